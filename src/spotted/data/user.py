@@ -2,7 +2,9 @@
 
 from dataclasses import dataclass
 from datetime import datetime
+from functools import lru_cache
 from random import choice
+from time import monotonic
 
 from telegram import Bot
 
@@ -10,6 +12,20 @@ from .data_reader import read_md
 from .db_manager import DbManager
 from .pending_post import PendingPost
 
+USERNAME_CACHE_TTL = 300  # seconds a username fetched from telegram is considered valid
+_username_cache: dict[int, tuple[float, str | None]] = {}
+
+
+@lru_cache(maxsize=1)
+def _anonym_names() -> tuple[str, ...]:
+    """Reads the list of random names used to sign anonym users.
+    The file is only read once, since it does not change at runtime
+
+    Returns:
+        tuple of the available anonym names
+    """
+    return tuple(read_md("anonym_names").split("\n"))
+
 
 @dataclass()
 class User:
@@ -128,11 +144,28 @@ class User:
             the sign of the user
         """
         if self.is_credited:  # the user wants to be credited
-            chat = await bot.get_chat(self.user_id)
-            if chat.username:
-                return f"@{chat.username}"
+            username = await self.__get_username(bot)
+            if username:
+                return f"@{username}"
+
+        return choice(_anonym_names())  # random sign
 
-        return choice(read_md("anonym_names").split("\n"))  # random sign
+    async def __get_username(self, bot: Bot) -> str | None:
+        """Gets the username of the user from telegram.
+        The result is cached for USERNAME_CACHE_TTL seconds, to avoid a request for each post
+
+        Args:
+            bot: telegram bot
+
+        Returns:
+            the username of the user, if any
+        """
+        cached = _username_cache.get(self.user_id)
+        if cached is not None and monotonic() - cached[0] < USERNAME_CACHE_TTL:
+            return cached[1]
+        chat = await bot.get_chat(self.user_id)
+        _username_cache[self.user_id] = (monotonic(), chat.username)
+        return chat.username
 
     def is_following(self, message_id: int) -> bool:
         """Verifies if the user is following a post
@@ -126,7 +126,10 @@ def add_handlers(app: Application):
     app.add_handler(CallbackQueryHandler(follow_spot_callback, pattern=r"^follow_\.*"))
 
     if Config.post_get("comments"):
-        app.add_handler(MessageHandler(community_filter & filters.IS_AUTOMATIC_FORWARD, forwarded_post_msg))
+        # the sign of the post is sent without blocking the handling of other updates
+        app.add_handler(
+            MessageHandler(community_filter & filters.IS_AUTOMATIC_FORWARD, forwarded_post_msg, block=False)
+        )
 
     if Config.post_get("delete_anonymous_comments"):
         app.add_handler(
@@ -2,3 +2,6 @@
 
 APPROVED_KB = "✅ Approvato"
 REJECTED_KB = "❌ Rifiutato"
+
+# Attributes of a message that, if present, make it a supported post
+VALID_MESSAGE_TYPE_ATTRS = ("text", "photo", "voice", "audio", "video", "animation", "sticker", "poll")
@@ -43,7 +43,7 @@ def conv_fail(
         Returns:
             new state of the conversation
         """
-        info = event if isinstance(event, EventInfo) else EventInfo.from_message(*event)
+        info = event if isinstance(event, EventInfo) else EventInfo.from_update(*event)
         text = read_md(f"{family}_error_{fail_file}", **kwargs)
         await info.bot.send_message(chat_id=info.chat_id, text=text, parse_mode=ParseMode.MARKDOWN_V2)
         return return_value
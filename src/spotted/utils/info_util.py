@@ -1,5 +1,7 @@
 """Common info needed in both command and callback handlers"""
 
+from functools import cached_property
+
 from telegram import (
     Bot,
     CallbackQuery,
@@ -17,6 +19,7 @@ from telegram.ext import CallbackContext
 
 from spotted.data import Config, PendingPost, PublishedPost, User
 from spotted.debug.log_manager import logger
+from spotted.utils.constants import VALID_MESSAGE_TYPE_ATTRS
 from spotted.utils.keyboard_util import (
     get_approve_kb,
     get_post_outcome_kb,
@@ -27,6 +30,9 @@ from spotted.utils.keyboard_util import (
 class EventInfo:  # pylint: disable=too-many-public-methods
     """Class that contains all the relevant information related to an event"""
 
+    # __dict__ is kept to store the values computed by the cached properties
+    __slots__ = ("_bot", "_ctx", "_update", "_message", "_query", "__dict__")
+
     def __init__(
         self,
         bot: Bot,
@@ -35,57 +41,57 @@ class EventInfo:  # pylint: disable=too-many-public-methods
         message: Message = None,
         query: CallbackQuery = None,
     ):
-        self.__bot = bot
-        self.__ctx = ctx
-        self.__update = update
-        self.__message = message
-        self.__query = query
+        self._bot = bot
+        self._ctx = ctx
+        self._update = update
+        self._message = message
+        self._query = query
 
     @property
     def bot(self) -> Bot:
         """Instance of the telegram bot"""
-        return self.__bot
+        return self._bot
 
     @property
     def context(self) -> CallbackContext:
         """Context generated by some event"""
-        return self.__ctx
+        return self._ctx
 
     @property
     def update(self) -> Update:
         """Update generated by some event"""
-        return self.__update
+        return self._update
 
     @property
     def message(self) -> Message:
         """Message that caused the update"""
-        return self.__message
+        return self._message
 
     @property
     def bot_data(self) -> dict:
         """Data related to the bot. Is not persistent between restarts"""
-        return self.__ctx.bot_data
+        return self._ctx.bot_data
 
     @property
     def user_data(self) -> dict:
         """Data related to the user. Is not persistent between restarts"""
-        return self.__ctx.user_data
+        return self._ctx.user_data
 
-    @property
+    @cached_property
     def chat_id(self) -> int:
         """Id of the chat where the event happened"""
-        if self.__message is None:
+        if self._message is None:
             return None
-        return self.__message.chat_id
+        return self._message.chat_id
 
-    @property
+    @cached_property
     def chat_type(self) -> str:
         """Type of the chat where the event happened"""
-        if self.__message is None:
+        if self._message is None:
             return None
-        return self.__message.chat.type
+        return self._message.chat.type
 
-    @property
+    @cached_property
     def is_private_chat(self) -> bool:
         """Whether the chat is private or not"""
 
@@ -93,165 +99,176 @@ class EventInfo:  # pylint: disable=too-many-public-methods
             return None
         return self.chat_type == Chat.PRIVATE
 
-    @property
+    @cached_property
     def text(self) -> str:
         """Text of the message that caused the update"""
-        if self.__message is None:
+        if self._message is None:
             return None
-        return self.__message.text
+        return self._message.text
 
     @property
     def callback_key(self) -> str:
         """Return the args of the message that caused the update.
         If the update was caused by a callback, the callback data is splitted by ',' and returned"""
-        if self.__query is None or self.__query.data is None:
+        if self._query is None or self._query.data is None:
             return ""
-        return self.__query.data.split(",")[0]
+        return self._query.data.split(",")[0]
 
     @property
     def args(self) -> list[str]:
         """Return the args of the message that caused the update.
         If the update was caused by a callback, the callback data is splitted by ',' and returned"""
         # if the update was caused by a callback, the callback data is splitted by ',' and returned
-        if self.__query is not None and self.__query.data is not None:
-            args = self.__query.data.split(",")
+        if self._query is not None and self._query.data is not None:
+            args = self._query.data.split(",")
             if len(args) > 1:
                 return args[1:]
             return []
         # if the update was caused by a command, use the built-in args
-        if self.__ctx.args is not None:
-            return self.__ctx.args
+        if self._ctx.args is not None:
+            return self._ctx.args
         # if the update was caused by a text message, split the text and take all the words but the first one
         if self.text is not None:
             words = self.text.split(" ")
             return words[1:] if len(words) > 1 else []
         return []
 
-    @property
+    @cached_property
     def message_id(self) -> int:
         """Id of the message that caused the update"""
-        if self.__message is None:
+        if self._message is None:
             return None
-        return self.__message.message_id
+        return self._message.message_id
 
-    @property
+    @cached_property
     def is_valid_message_type(self) -> bool:
         """Whether or not the type of the message is supported"""
-        if self.__message is None:
+        if self._message is None:
             return False
-        return bool(
-            self.__message.text
-            or self.__message.photo
-            or self.__message.voice
-            or self.__message.audio
-            or self.__message.video
-            or self.__message.animation
-            or self.__message.sticker
-            or self.__message.poll
-        )
+        return any(getattr(self._message, attr) for attr in VALID_MESSAGE_TYPE_ATTRS)
 
-    @property
+    @cached_property
     def reply_markup(self) -> InlineKeyboardMarkup:
         """Reply_markup of the message that caused the update"""
-        if self.__message is None:
+        if self._message is None:
             return None
-        return self.__message.reply_markup
+        return self._message.reply_markup
 
-    @property
+    @cached_property
     def user_id(self) -> int:
         """Id of the user that caused the update"""
-        if self.__query is not None:
-            return self.__query.from_user.id
-        if self.__message is not None:
-            return self.__message.from_user.id
+        if self._query is not None:
+            return self._query.from_user.id
+        if self._message is not None:
+            return self._message.from_user.id
         return None
 
-    @property
+    @cached_property
     def user_username(self) -> str:
         """Username of the user that caused the update"""
-        if self.__query is not None:
-            return self.__query.from_user.username
-        if self.__message is not None:
-            return self.__message.from_user.username
+        if self._query is not None:
+            return self._query.from_user.username
+        if self._message is not None:
+            return self._message.from_user.username
         return None
 
     @property
     def user_name(self) -> str:
         """Name of the user that caused the update"""
-        if self.__query is not None:
-            return self.__query.from_user.name
-        if self.__message is not None:
-            return self.__message.from_user.name
+        if self._query is not None:
+            return self._query.from_user.name
+        if self._message is not None:
+            return self._message.from_user.name
         return None
 
     @property
     def inline_keyboard(self) -> InlineKeyboardMarkup:
         """InlineKeyboard attached to the message"""
-        if self.__message is None:
+        if self._message is None:
             return None
-        return self.__message.reply_markup
+        return self._message.reply_markup
 
-    @property
+    @cached_property
     def query_id(self) -> str:
         """Id of the query that caused the update"""
-        if self.__query is None:
+        if self._query is None:
             return None
-        return self.__query.id
+        return self._query.id
 
-    @property
+    @cached_property
     def query_data(self) -> str:
         """Data associated with the query that caused the update"""
-        if self.__query is None:
+        if self._query is None:
             return None
-        return self.__query.data
+        return self._query.data
 
     @property
     def forward_from_id(self) -> int:
         """Id of the original message that has been forwarded"""
-        if self.__message is None:
+        if self._message is None:
             return None
-        if isinstance(self.__message.forward_origin, MessageOriginChannel):
-            return self.__message.forward_origin.message_id
+        if isinstance(self._message.forward_origin, MessageOriginChannel):
+            return self._message.forward_origin.message_id
         return None
 
     @property
     def forward_from_chat_id(self) -> int:
         """Id of the original chat the message has been forwarded from"""
-        if self.__message is None:
+        if self._message is None:
             return None
-        if isinstance(self.__message.forward_origin, MessageOriginChannel):
-            return self.__message.forward_origin.chat.id
-        if isinstance(self.__message.forward_origin, MessageOriginChat):
-            return self.__message.forward_origin.sender_chat.id
-        if isinstance(self.__message.forward_origin, MessageOriginUser):
-            return self.__message.forward_origin.sender_user.id
+        if isinstance(self._message.forward_origin, MessageOriginChannel):
+            return self._message.forward_origin.chat.id
+        if isinstance(self._message.forward_origin, MessageOriginChat):
+            return self._message.forward_origin.sender_chat.id
+        if isinstance(self._message.forward_origin, MessageOriginUser):
+            return self._message.forward_origin.sender_user.id
         return None
 
     @property
     def is_forward_from_channel(self) -> bool:
         """Whether the message has been forwarded from a channel"""
-        return isinstance(self.__message.forward_origin, MessageOriginChannel)
+        return isinstance(self._message.forward_origin, MessageOriginChannel)
 
     @property
     def is_forward_from_chat(self) -> bool:
         """Whether the message has been forwarded from a chat"""
-        return isinstance(self.__message.forward_origin, MessageOriginChat)
+        return isinstance(self._message.forward_origin, MessageOriginChat)
 
     @property
     def is_forward_from_user(self) -> bool:
         """Whether the message has been forwarded from a user"""
-        return isinstance(self.__message.forward_origin, MessageOriginUser)
+        return isinstance(self._message.forward_origin, MessageOriginUser)
 
     @property
     def is_forwarded_post(self) -> bool:
         """Whether the message is in fact a forwarded post from the channel to the group"""
         return (
             self.chat_id == Config.post_get("community_group_id")
-            and isinstance(self.__message.forward_origin, MessageOriginChannel)
-            and self.__message.forward_origin.chat.id == Config.post_get("channel_id")
-            and self.__message.is_automatic_forward
+            and isinstance(self._message.forward_origin, MessageOriginChannel)
+            and self._message.forward_origin.chat.id == Config.post_get("channel_id")
+            and self._message.is_automatic_forward
         )
 
+    @classmethod
+    def from_update(cls, update: Update | None, ctx: CallbackContext) -> "EventInfo":
+        """Instance of EventInfo created by any kind of update.
+        The callback query, the message or neither of them are used, depending on the content of the update
+
+        Args:
+            update: update event. None if the instance is created by a job
+            context: context passed by the handler
+
+        Returns:
+            instance of the class
+        """
+        if update is None:
+            return cls(bot=ctx.bot, ctx=ctx)
+        query = update.callback_query
+        if query is not None:
+            return cls(bot=ctx.bot, ctx=ctx, update=update, message=query.message, query=query)
+        message = update.message if update.message is not None else update.edited_message
+        return cls(bot=ctx.bot, ctx=ctx, update=update, message=message)
+
     @classmethod
     def from_message(cls, update: Update, ctx: CallbackContext) -> "EventInfo":
         """Instance of EventInfo created by a message update
@@ -291,7 +308,7 @@ class EventInfo:  # pylint: disable=too-many-public-methods
         Returns:
             instance of the class
         """
-        return cls(bot=ctx.bot, ctx=ctx)
+        return cls.from_update(None, ctx)
 
     async def answer_callback_query(self, text: str = None):
         """Calls the answer_callback_query method of the bot class, while also handling the exception
@@ -300,7 +317,7 @@ class EventInfo:  # pylint: disable=too-many-public-methods
             text: Text to show to the user
         """
         try:
-            await self.__bot.answer_callback_query(callback_query_id=self.query_id, text=text)
+            await self._bot.answer_callback_query(callback_query_id=self.query_id, text=text)
         except BadRequest as ex:
             logger.warning("On answer_callback_query: %s", ex)
 
@@ -318,7 +335,7 @@ class EventInfo:  # pylint: disable=too-many-public-methods
         chat_id = chat_id if chat_id is not None else self.chat_id
         message_id = message_id if message_id is not None else self.message_id
         try:
-            await self.__bot.edit_message_reply_markup(
+            await self._bot.edit_message_reply_markup(
                 chat_id=chat_id, message_id=message_id, reply_markup=new_keyboard
             )
         except BadRequest as ex:
@@ -330,16 +347,16 @@ class EventInfo:  # pylint: disable=too-many-public-methods
         Returns:
             whether or not the operation was successful
         """
-        message = self.__message.reply_to_message
+        message = self._message.reply_to_message
         admin_group_id = Config.post_get("admin_group_id")
         poll = message.poll  # if the message is a poll, get its reference
 
         try:
             if poll:  # makes sure the poll is anonym
-                g_message = await self.__bot.send_poll(
+                g_message = await self._bot.send_poll(
                     chat_id=admin_group_id,
                     question=poll.question,
-                    options=[option.text for option in poll.options],
+                    options=tuple(option.text for option in poll.options),
                     type=poll.type,
                     allows_multiple_answers=poll.allows_multiple_answers,
                     correct_option_id=poll.correct_option_id,
@@ -347,7 +364,7 @@ class EventInfo:  # pylint: disable=too-many-public-methods
                 )
             elif message.text and message.entities:  # maintains the previews, if present
                 show_preview = self.user_data.get("show_preview", True)
-                g_message = await self.__bot.send_message(
+                g_message = await self._bot.send_message(
                     chat_id=admin_group_id,
                     text=message.text,
                     reply_markup=get_approve_kb(),
@@ -355,7 +372,7 @@ class EventInfo:  # pylint: disable=too-many-public-methods
                     link_preview_options=LinkPreviewOptions(not show_preview),
                 )
             else:
-                g_message = await self.__bot.copy_message(
+                g_message = await self._bot.copy_message(
                     chat_id=admin_group_id,
                     from_chat_id=message.chat_id,
                     message_id=message.message_id,
@@ -372,48 +389,53 @@ class EventInfo:  # pylint: disable=too-many-public-methods
     async def send_post_to_channel(self, user_id: int):
         """Sends the post to  the channel, so it can be enjoyed by the users (and voted, if comments are disabled)"""
 
-        message = self.__message
+        message = self._message
         channel_id = Config.post_get("channel_id")
+        comments = Config.post_get("comments")
         poll = message.poll  # if the message is a poll, get its reference
 
         reply_markup = None
         # ... append the voting Inline Keyboard, if comments are not to be supported
-        if not Config.post_get("comments"):
+        if not comments:
             reply_markup = get_published_post_kb()
         if poll:  # makes sure the poll is anonym
-            c_message = await self.__bot.send_poll(
+            c_message = await self._bot.send_poll(
                 chat_id=channel_id,
                 question=poll.question,
-                options=[option.text for option in poll.options],
+                options=tuple(option.text for option in poll.options),
                 type=poll.type,
                 allows_multiple_answers=poll.allows_multiple_answers,
                 correct_option_id=poll.correct_option_id,
                 reply_markup=reply_markup,
             )
         else:
-            c_message = await self.__bot.copy_message(
+            c_message = await self._bot.copy_message(
                 chat_id=channel_id,
                 from_chat_id=message.chat_id,
                 message_id=message.message_id,
                 reply_markup=reply_markup,
             )
 
-        if not Config.post_get("comments"):  # if the user can vote directly on the post
+        if not comments:  # if the user can vote directly on the post
             PublishedPost.create(c_message_id=c_message.message_id, channel_id=channel_id)
         else:  # ... else, if comments are enabled, save the user_id, so the user can be credited
-            self.bot_data[f"{channel_id},{c_message.message_id}"] = user_id
+            self.bot_data[(channel_id, c_message.message_id)] = user_id
 
     async def send_post_to_channel_group(self):
         """Sends the post to the group associated to the channel,
         so that users can vote the post (if comments are enabled)
         """
 
-        message = self.__message
+        message = self._message
         community_group_id = Config.post_get("community_group_id")
-        user_id = self.bot_data.pop(f"{self.forward_from_chat_id},{self.forward_from_id}", -1)
-
-        sign = await User(user_id).get_user_sign(bot=self.__bot)
-        post_message = await self.__bot.send_message(
+        post_key = (self.forward_from_chat_id, self.forward_from_id)
+        user_id = self.bot_data.pop(post_key, None)
+        if user_id is None:  # bot_data is not persistent, so the author is lost if the bot has been restarted
+            logger.warning("Author of the post %s not found, it will be signed anonymously", post_key)
+            user_id = -1
+
+        sign = await User(user_id).get_user_sign(bot=self._bot)
+        post_message = await self._bot.send_message(
             chat_id=community_group_id,
             text=f"by: {sign}",
             reply_markup=get_published_post_kb(),
@@ -431,10 +453,10 @@ class EventInfo:  # pylint: disable=too-many-public-methods
             reason: reason for the rejection, currently used on autoreply
         """
         inline_keyboard = await get_post_outcome_kb(
-            bot=self.__bot, votes=pending_post.get_list_admin_votes(), reason=reason
+            bot=self._bot, votes=pending_post.get_list_admin_votes(), reason=reason
         )
 
-        await self.__bot.edit_message_reply_markup(
+        await self._bot.edit_message_reply_markup(
             chat_id=pending_post.admin_group_id, message_id=pending_post.g_message_id, reply_markup=inline_keyboard
         )
 
@@ -454,6 +476,6 @@ class EventInfo:  # pylint: disable=too-many-public-methods
             text = f"⬆️ Post in attesa\nRimangono {remaining_pending_posts_count} post in attesa"
             oldest_pending_post = remaining_pending_posts[0]
 
-            await self.__bot.send_message(
+            await self._bot.send_message(
                 chat_id=pending_post.admin_group_id, text=text, reply_to_message_id=oldest_pending_post.g_message_id
             )
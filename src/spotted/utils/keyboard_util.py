@@ -1,6 +1,7 @@
 """Creates the inlinekeyboard sent by the bot in its messages.
 Callback_data format: <callback_family>_<callback_name>,[arg]"""
 
+from functools import lru_cache
 from itertools import islice, zip_longest
 
 from telegram import Bot, InlineKeyboardButton, InlineKeyboardMarkup
@@ -73,11 +74,24 @@ def get_approve_kb(pending_post: PendingPost = None, approve: int = -1, reject:
         new inline keyboard
     """
     if pending_post is None:  # the post has just been created
-        n_approve = 0
-        n_reject = 0
-    else:
-        n_approve = pending_post.get_votes(vote=True) if approve < 0 else approve
-        n_reject = pending_post.get_votes(vote=False) if reject < 0 else reject
+        return _get_approve_kb(n_approve=0, n_reject=0)
+    n_approve = pending_post.get_votes(vote=True) if approve < 0 else approve
+    n_reject = pending_post.get_votes(vote=False) if reject < 0 else reject
+    return _get_approve_kb(n_approve=n_approve, n_reject=n_reject)
+
+
+@lru_cache(maxsize=32)
+def _get_approve_kb(n_approve: int, n_reject: int) -> InlineKeyboardMarkup:
+    """Generates the InlineKeyboard for the pending post with the given number of votes.
+    The keyboards are immutable, so the same instance is reused for the same votes
+
+    Args:
+        n_approve: number of approve votes
+        n_reject: number of reject votes
+
+    Returns:
+        inline keyboard
+    """
     return InlineKeyboardMarkup(
         [
             [
@@ -152,11 +166,25 @@ def get_published_post_kb() -> InlineKeyboardMarkup | None:
     Returns:
         new inline keyboard
     """
+    return _get_published_post_kb(report=bool(Config.post_get("report")))
+
+
+@lru_cache(maxsize=2)
+def _get_published_post_kb(report: bool) -> InlineKeyboardMarkup | None:
+    """Generates the InlineKeyboard for the published post.
+    The keyboards are immutable, so the same instance is reused as long as the settings don't change
+
+    Args:
+        report: whether the report button should be added
+
+    Returns:
+        inline keyboard
+    """
     keyboard: list[InlineKeyboardButton] = []
     # the last button in the last row will be the report button
     report_button = InlineKeyboardButton("🚩 Report", callback_data="report_spot")
     follow_button = InlineKeyboardButton("👁 Follow", callback_data="follow_spot")
-    if Config.post_get("report"):
+    if report:
         if len(keyboard) > 0:
             keyboard[-1].append(report_button)
         else:
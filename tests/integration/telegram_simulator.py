@@ -1,5 +1,6 @@
 # pylint: disable=unused-argument,protected-access,no-value-for-parameter
 """TelegramSimulator class"""
+import asyncio
 import warnings
 from datetime import datetime
 from typing import overload
@@ -30,6 +31,7 @@ class TelegramSimulator:  # pylint: disable=too-many-public-methods
 
     def __init__(self):
         warnings.filterwarnings("ignore", message=r"Setting custom attributes such as .*")
+        warnings.filterwarnings("ignore", message=r"Tasks created via `Application.create_task` .*")
         self.messages: list[Message] = []
         self.app = Application.builder().token("1234567890:qY9gv7pRJgFj4EVmN3Z1gfJOgQpCbh0vmp5").build()
         add_handlers(self.app)
@@ -37,6 +39,17 @@ class TelegramSimulator:  # pylint: disable=too-many-public-methods
         self.bot._post = self.weaved_post().__get__(self.bot, self.bot.__class__)
         self.__api = TelegramApi(self)
 
+    async def __process_update(self, update: Update):
+        """Lets the application process the update, waiting for the non-blocking handlers to finish too
+
+        Args:
+            update: update to process
+        """
+        await self.app.initialize()
+        await self.app.process_update(update)
+        # the application is not running, so the tasks of the non-blocking handlers are not tracked by it
+        await asyncio.gather(*(task for task in asyncio.all_tasks() if task is not asyncio.current_task()))
+
     @property
     def last_message(self) -> Message:
         """Last message registered"""
@@ -180,8 +193,7 @@ class TelegramSimulator:  # pylint: disable=too-many-public-methods
             )
         self.add_message(message)
         update = self.make_update(message)
-        await self.app.initialize()
-        await self.app.process_update(update)
+        await self.__process_update(update)
         return message
 
     async def send_callback_query(
@@ -213,8 +225,7 @@ class TelegramSimulator:  # pylint: disable=too-many-public-methods
         if query is None:
             query = self.make_callback_query(user=user, chat=chat, data=data, message=message, **kwargs)
         update = self.make_update(query)
-        await self.app.initialize()
-        await self.app.process_update(update)
+        await self.__process_update(update)
         return query
 
     async def send_forward_message(
@@ -262,8 +273,7 @@ class TelegramSimulator:  # pylint: disable=too-many-public-methods
             )
         self.add_message(message)
         update = self.make_update(message)
-        await self.app.initialize()
-        await self.app.process_update(update)
+        await self.__process_update(update)
         return message
 
     def make_message(
@@ -212,3 +212,27 @@ class TestUtil:
             assert info.query_data is None
             assert info.forward_from_id is None
             assert info.forward_from_chat_id is None
+
+        def test_update_info(
+            self,
+            message_update: tuple[Update, CallbackContext],
+            callback_update: tuple[Update, CallbackContext],
+            job_update: CallbackContext,
+            get_message: Message,
+            get_callback_query: CallbackQuery,
+        ):
+            """Tests the :meth:`from_update` :class:`EventInfo` initialization"""
+            info = EventInfo.from_update(message_update[0], message_update[1])
+            assert info.update == message_update[0]
+            assert info.message == get_message
+            assert info.query_id is None
+
+            info = EventInfo.from_update(callback_update[0], callback_update[1])
+            assert info.update == callback_update[0]
+            assert info.message == get_message
+            assert info.query_id == get_callback_query.id
+
+            info = EventInfo.from_update(None, job_update)
+            assert info.context == job_update
+            assert info.update is None
+            assert info.message is None